@@ -0,0 +1,31 @@
+# cython: language_level=3
+"""
+Optional Cython build of the word filter used by main.py.
+
+Build in place with:
+
+    cythonize -i filters.pyx
+
+main.py falls back to its pure-Python filter when this module is not built.
+"""
+
+
+def filter_words(tuple words, frozenset stopwords, Py_ssize_t min_length):
+    """
+    Strip segmented words and drop short words and stopwords.
+    
+    Args:
+        words: Raw words produced by jieba
+        stopwords: Frozen set of words to exclude
+        min_length: Minimum word length to include (at least 1)
+        
+    Returns:
+        Tuple of filtered words
+    """
+    cdef list out = []
+    cdef str w
+    for w in words:
+        w = w.strip()
+        if len(w) >= min_length and w not in stopwords:
+            out.append(w)
+    return tuple(out)
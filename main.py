@@ -5,19 +5,51 @@ Generates word clouds from CSV text data with customizable settings.
 
 import os
 import sys
+import csv
+import io
 import logging
 import argparse
-from typing import Dict, Set, Counter as CounterType
+import multiprocessing
+from multiprocessing.pool import Pool
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Sequence, Tuple, Counter as CounterType
 from pathlib import Path
 import pandas as pd
-import jieba
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from collections import Counter
+from contextlib import suppress
 import yaml
 import numpy as np
 from matplotlib.colors import LinearSegmentedColormap
 
+# jieba_fast is an optional, API-compatible drop-in with Cython hot loops
+try:
+    import jieba_fast as jieba
+except ImportError:
+    import jieba
+
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Optional Cython build of the word filter (see filters.pyx)
+try:
+    from filters import filter_words
+except ImportError:
+    filter_words = None
+
+# PyArrow is optional; when installed it is used for faster CSV reading and writing
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,7 +75,7 @@ def load_config(config_path: str = 'config.yaml') -> Dict:
     """
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         logger.info(f"Configuration loaded from {config_path}")
         return config
     except FileNotFoundError:
@@ -68,14 +100,21 @@ def validate_config(config: Dict) -> Dict:
         'csv_path': 'data/input.csv',
         'text_column': 'title',
         'output_img': 'output/wordcloud.png',
+        'save_segmented': False,
         'font_path': '/System/Library/Fonts/STHeiti Medium.ttc',
         'background_color': 'white',
         'width': 1920,
         'height': 1080,
         'colormap': 'viridis',
         'min_word_length': 2,
+        'chunksize': 250_000,
+        'workers': 0,
+        'jieba_cache_dir': None,
         'max_words': 200,
+        'min_count': 1,
         'relative_scaling': 0.5,
+        'layout_scale': 1,
+        'prefer_horizontal': 0.9,
         'use_custom_colors': False,
         'custom_colors': []
     }
@@ -94,6 +133,25 @@ def validate_config(config: Dict) -> Dict:
     if config['min_word_length'] < 1:
         config['min_word_length'] = 1
     
+    # The layout canvas must scale back up to exactly width x height, so
+    # layout_scale is an integer that divides both dimensions
+    layout_scale = max(1, int(config['layout_scale']))
+    while config['width'] % layout_scale or config['height'] % layout_scale:
+        layout_scale -= 1
+    if layout_scale != config['layout_scale']:
+        logger.warning(
+            f"layout_scale must be an integer dividing width and height, "
+            f"using {layout_scale}"
+        )
+        config['layout_scale'] = layout_scale
+    
+    if config['chunksize'] < 1:
+        config['chunksize'] = defaults['chunksize']
+    
+    # 0 (or any non-positive value) means one worker per CPU core
+    if not config['workers'] or config['workers'] < 1:
+        config['workers'] = os.cpu_count() or 1
+    
     return config
 
 
@@ -109,7 +167,7 @@ def ensure_directories(*dirs: str) -> None:
         logger.debug(f"Directory ensured: {directory}")
 
 
-def load_stopwords(stopwords_path: str = 'data/stopwords.txt') -> Set[str]:
+def load_stopwords(stopwords_path: str = 'data/stopwords.txt') -> FrozenSet[str]:
     """
     Load stopwords from file.
     
@@ -117,114 +175,415 @@ def load_stopwords(stopwords_path: str = 'data/stopwords.txt') -> Set[str]:
         stopwords_path: Path to stopwords file
         
     Returns:
-        Set of stopwords
+        Frozen set of stopwords
     """
     if not os.path.exists(stopwords_path):
         logger.warning(f"Stopwords file not found: {stopwords_path}. Using empty set.")
-        return set()
+        return frozenset()
     
     try:
         with open(stopwords_path, encoding='utf-8') as f:
-            stopwords = set(line.strip() for line in f if line.strip())
+            stopwords = frozenset(map(str.strip, f.read().splitlines())) - {''}
         logger.info(f"Loaded {len(stopwords)} stopwords from {stopwords_path}")
         return stopwords
     except Exception as e:
         logger.error(f"Error loading stopwords: {e}")
-        return set()
+        return frozenset()
+
+
+def init_jieba(cache_dir: Optional[str] = None) -> None:
+    """
+    Load the jieba dictionary, caching the built prefix dictionary on disk.
+    
+    jieba pickles its prefix dictionary after the first build and reloads
+    that cache on later runs. The cache is kept in ``cache_dir``, or in
+    /dev/shm (tmpfs) when that exists, falling back to jieba's default
+    temporary directory. Also used as the initializer of segmentation
+    worker processes, so they share the same cache.
+    
+    Args:
+        cache_dir: Directory for jieba's dictionary cache
+    """
+    if cache_dir is None and os.path.isdir('/dev/shm'):
+        cache_dir = '/dev/shm'
+    if cache_dir:
+        jieba.dt.tmp_dir = cache_dir
+    jieba.initialize()
 
 
-def read_csv_data(csv_path: str, text_column: str) -> pd.DataFrame:
+def read_csv_data(
+    csv_path: str,
+    text_column: str,
+    chunksize: int = 250_000
+) -> Iterator[Sequence[str]]:
     """
-    Read CSV file and validate column exists.
+    Validate the CSV file and column, and return an iterator over its rows.
+    
+    The file and its header are checked immediately, so a missing file or
+    column is reported before any other work starts; only the rows are
+    read lazily, in chunks, as the returned iterator is consumed.
     
     Args:
         csv_path: Path to CSV file
         text_column: Name of the text column to read
+        chunksize: Number of rows per chunk
         
     Returns:
-        DataFrame containing the data
+        Iterator over chunks of text rows from the column
         
     Raises:
         FileNotFoundError: If CSV file doesn't exist
-        ValueError: If specified column doesn't exist
+        ValueError: If CSV file is empty or specified column doesn't exist
     """
     if not os.path.exists(csv_path):
         logger.error(f"CSV file not found: {csv_path}")
         raise FileNotFoundError(f"Please place your CSV file at {csv_path}")
     
+    # The csv module rejects fields over 128 KiB by default; pandas does
+    # not, so lift the limit for long free-text cells
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    
     try:
-        df = pd.read_csv(csv_path)
-        logger.info(f"CSV file loaded: {csv_path} ({len(df)} rows)")
-        
-        if text_column not in df.columns:
-            available_columns = ', '.join(df.columns)
-            logger.error(f"Column '{text_column}' not found. Available columns: {available_columns}")
-            raise ValueError(f"Column '{text_column}' not found in CSV. Available: {available_columns}")
-        
-        return df[[text_column]]
-    except pd.errors.EmptyDataError:
+        with open(csv_path, encoding='utf-8-sig', newline='') as f:
+            columns = next(csv.reader(f), None)
+    except Exception as e:
+        logger.error(f"Error reading CSV file: {e}")
+        raise
+    
+    if not columns:
         logger.error("CSV file is empty")
         raise ValueError("CSV file is empty")
+    
+    if text_column not in columns:
+        available_columns = ', '.join(columns)
+        logger.error(f"Column '{text_column}' not found. Available columns: {available_columns}")
+        raise ValueError(f"Column '{text_column}' not found in CSV. Available: {available_columns}")
+    
+    return _iter_csv_chunks(csv_path, columns.index(text_column), text_column, chunksize)
+
+
+def _row_cell(row: Sequence[str], index: int) -> str:
+    """Return the cell at ``index`` of a parsed CSV row, or '' if the row is short."""
+    return row[index] if len(row) > index else ''
+
+
+def _csv_cell(text: str, index: int) -> str:
+    """Parse a single raw CSV row and return the cell at ``index``."""
+    return _row_cell(next(csv.reader(io.StringIO(text)), []), index)
+
+
+def _iter_csv_chunks(
+    csv_path: str,
+    index: int,
+    text_column: str,
+    chunksize: int
+) -> Iterator[Sequence[str]]:
+    """
+    Read the text column of a validated CSV file in chunks.
+    
+    Only the text column is extracted, as plain lists of strings without
+    building DataFrames. Every chunk but the last has exactly ``chunksize``
+    rows, whichever backend reads it: PyArrow's streaming reader when it is
+    installed, otherwise the standard library csv module.
+    
+    Args:
+        csv_path: Path to CSV file
+        index: Position of the text column in the header
+        text_column: Name of the text column to read
+        chunksize: Number of rows per chunk
+        
+    Yields:
+        Chunks of text rows from the column
+    """
+    try:
+        total_rows = 0
+        if pa_csv is not None:
+            convert_options = pa_csv.ConvertOptions(
+                include_columns=[text_column],
+                column_types={text_column: pa.string()}
+            )
+            # Rows with a different number of fields than the header are
+            # skipped by pyarrow; keep their raw text and recover the cell
+            # with the csv module, as the fallback reader does
+            invalid_rows = []
+            
+            def recover_row(row) -> str:
+                invalid_rows.append(row.text)
+                return 'skip'
+            
+            # Quoted cells may contain line breaks, as pandas and csv accept
+            parse_options = pa_csv.ParseOptions(
+                newlines_in_values=True,
+                invalid_row_handler=recover_row
+            )
+            reader = pa_csv.open_csv(
+                csv_path,
+                parse_options=parse_options,
+                convert_options=convert_options
+            )
+            # Regroup the reader's blocks into chunks of exactly chunksize
+            # rows, carrying the remainder of each block into the next chunk
+            pending = pa.chunked_array([], pa.string())
+            # The trailing None picks up rows recovered after the last batch
+            for batch in chain(reader, [None]):
+                arrays = [] if batch is None else [batch.column(0)]
+                if invalid_rows:
+                    arrays.append(pa.array(
+                        [_csv_cell(text, index) for text in invalid_rows],
+                        pa.string()
+                    ))
+                    invalid_rows.clear()
+                pending = pa.chunked_array(pending.chunks + arrays, pa.string())
+                while len(pending) >= chunksize:
+                    total_rows += chunksize
+                    yield pending.slice(0, chunksize).to_pylist()
+                    pending = pending.slice(chunksize)
+            if len(pending):
+                total_rows += len(pending)
+                yield pending.to_pylist()
+        else:
+            with open(csv_path, encoding='utf-8-sig', newline='') as f:
+                reader = csv.reader(f)
+                next(reader)
+                while True:
+                    chunk = [_row_cell(row, index) for row in islice(reader, chunksize)]
+                    if not chunk:
+                        break
+                    total_rows += len(chunk)
+                    yield chunk
+        logger.info(f"CSV file loaded: {csv_path} ({total_rows} rows)")
     except Exception as e:
         logger.error(f"Error reading CSV file: {e}")
         raise
 
 
-def segment_text(text: str, stopwords: Set[str], min_length: int = 2) -> list:
+@lru_cache(maxsize=100_000)
+def _cut(text: str) -> Tuple[str, ...]:
+    """
+    Segment a single row with jieba, memoised on the row text.
+    
+    Text columns often repeat the same value (titles, queries). Duplicates
+    within a chunk are already collapsed by segment_text, so this cache
+    catches rows repeated across chunks. Defined at module level so it can
+    be sent to worker processes: each worker of the shared pool keeps its
+    own cache for the whole run, and a repeated row hits it when it is
+    dispatched to the same worker again.
+    
+    Words are interned so that the rows in the calling process's cache
+    share a single string object per distinct word. Rows returned from
+    worker processes are unpickled as new strings in the parent, so there
+    interning only saves memory within each worker's own cache.
+    
+    Args:
+        text: Row of text to segment
+        
+    Returns:
+        Tuple of raw words produced by jieba
+    """
+    return tuple(map(sys.intern, jieba.cut(text)))
+
+
+def _filter_words(
+    words: Tuple[str, ...],
+    stopwords: FrozenSet[str],
+    min_length: int
+) -> Tuple[str, ...]:
+    """
+    Strip segmented words and drop short words and stopwords.
+    
+    Pure-Python fallback for filters.filter_words, which is used instead
+    when the optional Cython extension has been built.
+    
+    Args:
+        words: Raw words produced by jieba
+        stopwords: Frozen set of words to exclude
+        min_length: Minimum word length to include (at least 1)
+        
+    Returns:
+        Tuple of filtered words
+    """
+    stripped = (w.strip() for w in words)
+    return tuple(w for w in stripped if len(w) >= min_length and w not in stopwords)
+
+
+if filter_words is None:
+    filter_words = _filter_words
+
+
+def segment_text(
+    texts: Sequence[str],
+    stopwords: FrozenSet[str],
+    min_length: int = 2,
+    workers: int = 1,
+    get_pool: Optional[Callable[[], Pool]] = None,
+    min_parallel_rows: int = 50_000
+) -> Iterator[Tuple[Tuple[str, ...], int]]:
     """
     Segment Chinese text into words using jieba and filter.
     
+    Duplicate rows are collapsed first, so each distinct row is segmented
+    once and reported together with the number of times it occurs. With
+    more than one worker and at least ``min_parallel_rows`` distinct rows,
+    they are distributed in batches to the shared worker pool and the
+    results are consumed in order as they arrive. Smaller inputs are
+    segmented in this process, where starting workers would cost more than
+    it saves.
+    
     Args:
-        text: Text to segment
-        stopwords: Set of words to exclude
+        texts: Rows of text to segment
+        stopwords: Frozen set of words to exclude
         min_length: Minimum word length to include
+        workers: Number of processes in the shared worker pool
+        get_pool: Callable returning the shared worker pool, or None to
+            always segment in this process
+        min_parallel_rows: Minimum number of distinct rows to use the pool
         
-    Returns:
-        List of segmented words
+    Yields:
+        Tuples of (segmented words of a row, number of occurrences of the row)
+    """
+    # Stopwords shorter than min_length are already rejected by the length
+    # check, so leave them out of the set that is probed for every word
+    stopwords = frozenset(w for w in stopwords if len(w) >= min_length)
+    row_counts = pd.Series(texts).value_counts(sort=False)
+    unique_texts = row_counts.index.tolist()
+    occurrences = row_counts.tolist()
+    logger.debug(f"Segmenting {len(unique_texts)} distinct rows out of {len(texts)}")
+    
+    if workers > 1 and get_pool is not None and len(unique_texts) >= min_parallel_rows:
+        batch_size = max(1, len(unique_texts) // (workers * 4))
+        rows = get_pool().imap(_cut, unique_texts, chunksize=batch_size)
+        for words, count in zip(rows, occurrences):
+            yield filter_words(words, stopwords, min_length), count
+    else:
+        for text, count in zip(unique_texts, occurrences):
+            yield filter_words(_cut(text), stopwords, min_length), count
+
+
+def _write_all(fd: int, data: bytearray) -> None:
+    """
+    Write a buffer to a raw file descriptor, retrying on partial writes.
+    
+    Args:
+        fd: File descriptor opened for writing
+        data: Bytes to write
     """
-    logger.info("Starting text segmentation...")
-    words = jieba.cut(text)
-    word_list = [
-        w.strip() 
-        for w in words 
-        if w.strip() 
-        and len(w.strip()) >= min_length
-        and w.strip() not in stopwords
-    ]
-    logger.info(f"Segmentation complete: {len(word_list)} words extracted")
-    return word_list
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
-def save_segmented_words(word_list: list, output_path: str) -> None:
+def save_segmented_words(
+    segments: Iterable[Tuple[Tuple[str, ...], int]],
+    output_path: str
+) -> Iterator[Tuple[Tuple[str, ...], int]]:
     """
-    Save segmented words to a text file.
+    Save segmented words to a text file while passing them through.
+    
+    The words are written as they are consumed, so the file is produced in
+    the same pass that counts them without building a list. Rows are
+    encoded to UTF-8 into a byte buffer that is flushed to the file
+    descriptor with os.write once it reaches 1 MiB, and the words of a row
+    that occurs several times are repeated once per occurrence. Only errors
+    opening or writing the file are reported here; if the run fails, the
+    partial file is removed.
     
     Args:
-        word_list: List of words to save
+        segments: Tuples of (words of a row, number of occurrences)
         output_path: Path to output file
+    
+    Yields:
+        The saved segments, unchanged
     """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for word in word_list:
-                f.write(word + '\n')
-        logger.info(f"Segmented words saved to {output_path}")
-    except Exception as e:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(output_path, flags, 0o644)
+    except OSError as e:
         logger.error(f"Error saving segmented words: {e}")
         raise
+    
+    def flush(buffer: bytearray) -> None:
+        try:
+            _write_all(fd, buffer)
+        except OSError as e:
+            logger.error(f"Error saving segmented words: {e}")
+            raise
+        buffer.clear()
+    
+    # Errors from upstream (reading or segmenting) pass through unchanged
+    completed = False
+    try:
+        buffer = bytearray()
+        for words, count in segments:
+            if words:
+                buffer += ('\n'.join(words) + '\n').encode('utf-8') * count
+                if len(buffer) >= 1 << 20:
+                    flush(buffer)
+            yield words, count
+        flush(buffer)
+        completed = True
+    finally:
+        os.close(fd)
+        if not completed:
+            # Don't leave a partial file behind after a failed run
+            with suppress(OSError):
+                os.remove(output_path)
+    logger.info(f"Segmented words saved to {output_path}")
+
+
+def count_words(segments: Iterable[Tuple[Tuple[str, ...], int]]) -> CounterType:
+    """
+    Count word frequencies, weighting each row by its number of occurrences.
+    
+    Args:
+        segments: Tuples of (words of a row, number of occurrences)
+        
+    Returns:
+        Counter object with word frequencies
+    """
+    word_counts = Counter()
+    for words, count in segments:
+        if count == 1:
+            word_counts.update(words)
+        else:
+            for word in words:
+                word_counts[word] += count
+    return word_counts
 
 
 def save_word_counts(word_counts: CounterType, output_path: str) -> None:
     """
     Save word frequency counts to CSV.
     
+    Uses PyArrow's CSV writer when it is installed, otherwise pandas. Both
+    write the same file: fields are only quoted when they contain a comma,
+    quote or line break. PyArrow quotes every string field unless quoting
+    is disabled entirely, so it writes unquoted and leaves the rare file
+    with words that need quoting to pandas.
+    
     Args:
         word_counts: Counter object with word frequencies
         output_path: Path to output CSV file
     """
     try:
-        df = pd.DataFrame(word_counts.most_common(), columns=['word', 'count'])
-        df.to_csv(output_path, index=False, encoding='utf-8')
-        logger.info(f"Word frequency counts saved to {output_path} (top word: '{df.iloc[0]['word']}' with {df.iloc[0]['count']} occurrences)")
+        words, counts = zip(*word_counts.most_common())
+        written = False
+        if pa_csv is not None:
+            table = pa.table({
+                'word': pa.array(words, pa.string()),
+                'count': pa.array(counts, pa.int64())
+            })
+            write_options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+            try:
+                with open(output_path, 'wb') as f:
+                    f.write(b'word,count\n')
+                    pa_csv.write_csv(table, f, write_options=write_options)
+                written = True
+            except pa.ArrowInvalid:
+                logger.debug("Words need quoting, writing word counts with pandas")
+        if not written:
+            df = pd.DataFrame({'word': words, 'count': counts})
+            df.to_csv(output_path, index=False, encoding='utf-8')
+        logger.info(f"Word frequency counts saved to {output_path} (top word: '{words[0]}' with {counts[0]} occurrences)")
     except Exception as e:
         logger.error(f"Error saving word counts: {e}")
         raise
@@ -259,6 +618,11 @@ def generate_wordcloud(
     """
     Generate word cloud from word frequencies.
     
+    Only the ``max_words`` most frequent words occurring at least
+    ``min_count`` times are passed to WordCloud. With ``layout_scale``
+    greater than 1, the layout is computed on a canvas that many times
+    smaller and rendered back up to the configured size.
+    
     Args:
         word_counts: Counter object with word frequencies
         config: Configuration dictionary
@@ -269,14 +633,24 @@ def generate_wordcloud(
     try:
         logger.info("Generating word cloud...")
         
+        # Drop rare words and keep only the words that can be displayed
+        frequencies = {
+            word: count
+            for word, count in word_counts.most_common(config['max_words'])
+            if count >= config['min_count']
+        }
+        
         # Prepare WordCloud parameters
+        layout_scale = config['layout_scale']
         wc_params = {
             'font_path': config['font_path'],
-            'width': config['width'],
-            'height': config['height'],
+            'width': config['width'] // layout_scale,
+            'height': config['height'] // layout_scale,
+            'scale': layout_scale,
             'background_color': config['background_color'],
             'max_words': config['max_words'],
-            'relative_scaling': config['relative_scaling']
+            'relative_scaling': config['relative_scaling'],
+            'prefer_horizontal': config['prefer_horizontal']
         }
         
         # Handle color configuration
@@ -287,7 +661,7 @@ def generate_wordcloud(
             wc_params['colormap'] = config['colormap']
         
         wc = WordCloud(**wc_params)
-        wc.generate_from_frequencies(word_counts)
+        wc.generate_from_frequencies(frequencies)
         logger.info("Word cloud generated successfully")
         return wc
     except Exception as e:
@@ -345,33 +719,70 @@ def main(config_path: str = 'config.yaml', display: bool = False) -> None:
         # Ensure directories exist
         ensure_directories('data', 'output')
         
-        # Read CSV data
-        df = read_csv_data(config['csv_path'], config['text_column'])
-        
-        # Combine all text content
-        text = ' '.join(df[config['text_column']].astype(str))
-        logger.info(f"Combined text length: {len(text)} characters")
+        # Validate the CSV file now; its rows are read lazily, one chunk at a time
+        chunks = read_csv_data(config['csv_path'], config['text_column'], config['chunksize'])
         
         # Load stopwords
         stopwords = load_stopwords('data/stopwords.txt')
         
-        # Segment text
-        word_list = segment_text(text, stopwords, config['min_word_length'])
+        # Load the segmentation dictionary once, before any workers start
+        init_jieba(config['jieba_cache_dir'])
+        
+        # A single worker pool is shared by all chunks; it is only started
+        # once a chunk is large enough to be worth segmenting in parallel
+        pool = None
         
-        if not word_list:
+        def get_pool() -> Pool:
+            nonlocal pool
+            if pool is None:
+                logger.info(f"Starting {config['workers']} segmentation workers")
+                # Workers started with spawn/forkserver do not inherit the
+                # parent's jieba state, so each one sets up its own
+                pool = multiprocessing.Pool(
+                    config['workers'],
+                    initializer=init_jieba,
+                    initargs=(config['jieba_cache_dir'],)
+                )
+            return pool
+        
+        try:
+            # Segment text chunk by chunk
+            logger.info("Starting text segmentation...")
+            segments = chain.from_iterable(
+                segment_text(
+                    chunk, stopwords, config['min_word_length'], config['workers'], get_pool
+                )
+                for chunk in chunks
+            )
+            
+            # Optionally save segmented words in the same pass that counts them
+            if config['save_segmented']:
+                segments = save_segmented_words(segments, 'output/segmented_words.txt')
+            
+            # Count word frequencies
+            word_counts = count_words(segments)
+        finally:
+            if pool is not None:
+                pool.terminate()
+        logger.info(f"Segmentation complete: {sum(word_counts.values())} words extracted")
+        
+        if not word_counts:
             logger.error("No words extracted from text. Check your data and stopwords.")
             sys.exit(1)
         
-        # Save segmented words
-        save_segmented_words(word_list, 'output/segmented_words.txt')
-        
-        # Count word frequencies
-        word_counts = Counter(word_list)
         logger.info(f"Unique words: {len(word_counts)}")
         
         # Save word counts
         save_word_counts(word_counts, 'output/word_counts.csv')
         
+        top_count = word_counts.most_common(1)[0][1]
+        if top_count < config['min_count']:
+            logger.error(
+                f"No word occurs at least min_count ({config['min_count']}) times; "
+                f"the most frequent word occurs {top_count} times. Lower min_count in your config."
+            )
+            sys.exit(1)
+        
         # Generate word cloud
         wc = generate_wordcloud(word_counts, config)
         